@@ -30,6 +30,36 @@ logger = logging.getLogger(__name__)
 if not PY2:
     basestring = str  # in Python 3
 
+# frozensets for fast membership tests on attribute access
+CONSTANTS = frozenset(CONSTANTS)
+FUNCTIONS = frozenset(FUNCTIONS)
+PROPERTIES = frozenset(PROPERTIES)
+CLASSES = frozenset(CLASSES)
+PROPERTY_LISTS = frozenset(PROPERTY_LISTS)
+
+# non-numeric responses from the Keithley and their python equivalents
+_SPECIAL = {'nil': None, 'true': True, 'false': False}
+_MISSING = object()
+
+# python bools and their TSP representation
+_BOOLSTR = {True: 'true', False: 'false'}
+
+# errors raised by pyvisa when reading binary values, newer versions raise
+# InvalidBinaryFormat which does not derive from ValueError
+try:
+    from pyvisa.errors import InvalidBinaryFormat
+    _BINARY_ERRORS = (visa.VisaIOError, ValueError, TypeError, InvalidBinaryFormat)
+except ImportError:
+    _BINARY_ERRORS = (visa.VisaIOError, ValueError, TypeError)
+
+
+def _format_arg(value):
+    """Formats a function argument for TSP. Floats, including numpy floats, are
+    formatted with full precision, all other values are used as they are."""
+    if isinstance(value, float):
+        return float.__repr__(value)
+    return str(value)
+
 
 def log_to_screen(level=logging.DEBUG):
     log_to_stream(None, level)  # sys.stderr by default
@@ -60,6 +90,8 @@ class MagicPropertyList(object):
 
     """
 
+    __slots__ = ('_name', '_parent')
+
     def __init__(self, name, parent):
         if not isinstance(name, basestring):
             raise ValueError('First argument must be of type str.')
@@ -124,6 +156,8 @@ class MagicFunction(object):
 
     """
 
+    __slots__ = ('_name', '_parent')
+
     def __init__(self, name, parent):
         if not isinstance(name, basestring):
             raise ValueError('First argument must be of type str.')
@@ -131,18 +165,16 @@ class MagicFunction(object):
         self._parent = parent
 
     def __call__(self, *args, **kwargs):
-        """Pass on calls to :meth:`parent._write`, store result in variable.
-        Querying results from function calls directly may result in
-        a VisaIOError if the function does not return anything."""
+        """Pass on calls to :meth:`parent._query_raw`, store result in variable and
+        print it in the same message. Functions which do not return anything print
+        'nil' which is parsed as `None`."""
 
-        # convert incompatible arguments, return all arguments as tuple
-        args = tuple(self._parent._convert_input(a) for a in args)
-        # remove outside brackets and all quotation marks
-        args_string = str(args).strip("(),").replace("'", "")
-        # pass on calls to self._write as string representing function call
-        self._parent._write('result = %s(%s)' % (self._name, args_string))
-        # query for result in second call
-        return self._parent._query('result')
+        # convert incompatible arguments, join as comma delimited string
+        args_string = ', '.join(_format_arg(self._parent._convert_input(a)) for a in args)
+        # call function and print its result with a single query
+        r = self._parent._query_raw('result = %s(%s) print(result)' %
+                                    (self._name, args_string))
+        return self._parent.parse_response(r)
 
 
 class MagicClass(object):
@@ -174,8 +206,8 @@ class MagicClass(object):
 
     """
 
-    _name = ''
-    _parent = None
+    # __dict__ holds dynamically created attributes
+    __slots__ = ('_name', '_parent', '__dict__')
 
     def __init__(self, name, parent=None):
         if not isinstance(name, basestring):
@@ -189,6 +221,12 @@ class MagicClass(object):
         Get attributes as usual if they exist. Otherwise, fall back to
         :meth:`__get_global_handler`.
         """
+        if attr_name in MagicClass.__slots__:
+            # slot has not been initialised, e.g., while copying
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (type(self), attr_name)
+                )
+
         try:
             try:
                 # check if attribute already exists. return attr if yes.
@@ -221,22 +259,27 @@ class MagicClass(object):
         new_name = '%s.%s' % (self._name, attr_name)
         new_name = new_name.strip('.')
 
+        # Handlers are cached in __dict__ under attr_name so that subsequent look-ups
+        # bypass __getattr__. Property values are always queried from the Keithley.
+
         if attr_name in FUNCTIONS:
             handler = MagicFunction(new_name, parent=self)
-            self.__dict__[new_name] = handler
+            self.__dict__[attr_name] = handler
 
         elif attr_name in PROPERTY_LISTS:
             handler = MagicPropertyList(new_name, parent=self)
+            self.__dict__[attr_name] = handler
 
         elif attr_name in PROPERTIES or attr_name in CONSTANTS:
             if new_name in PROPERTY_LISTS:
                 handler = MagicPropertyList(new_name, parent=self)
+                self.__dict__[attr_name] = handler
             else:
                 handler = self._query(new_name)
 
         elif attr_name in CLASSES:
             handler = MagicClass(new_name, parent=self)
-            self.__dict__[new_name] = handler
+            self.__dict__[attr_name] = handler
 
         else:
             raise AttributeError(
@@ -264,7 +307,6 @@ class MagicClass(object):
             raise ValueError('%s.%s is read-only.' % (self._name, attr_name))
         else:
             object.__setattr__(self, attr_name, value)
-            self.__dict__[attr_name] = value
 
     def _write(self, value):
         """Forward _write calls to parent class."""
@@ -274,6 +316,14 @@ class MagicClass(object):
         """Forward _query calls to parent class."""
         return self._parent._query(value)
 
+    def _query_raw(self, value):
+        """Forward _query_raw calls to parent class."""
+        return self._parent._query_raw(value)
+
+    def parse_response(self, string):
+        """Forward parse_response calls to parent class."""
+        return self._parent.parse_response(string)
+
     def _convert_input(self, value):
         """Forward _convert_input calls to parent class."""
         try:
@@ -348,7 +398,9 @@ class Keithley2600Base(MagicClass):
     arguments.
     """
 
-    _lock = threading.RLock()
+    _lock = threading.Lock()
+    _linefreq = None
+    _binary_failed = False
     connection = None
     connected = False
     busy = False
@@ -386,6 +438,8 @@ class Keithley2600Base(MagicClass):
 
         """
         connection_error = OSError if PY2 else ConnectionError
+        # close any existing connection instead of leaking its handle
+        self.disconnect()
         # noinspection PyBroadException
         try:
             self.connection = self.rm.open_resource(self.visa_address, **kwargs)
@@ -414,6 +468,8 @@ class Keithley2600Base(MagicClass):
         """
         Disconnects from Keithley.
         """
+        self._linefreq = None
+        self._binary_failed = False
         if self.connection:
             try:
                 self.connection.close()
@@ -441,44 +497,161 @@ class Keithley2600Base(MagicClass):
             raise KeithleyIOError(
                 'No connection to keithley present. Try to call connect().')
 
+    def _write_many(self, values):
+        """
+        Writes multiple TSP statements to Keithley in a single message. Input must
+        be an iterable of strings.
+        """
+        self._write('; '.join(values))
+
     def _query(self, value):
         """
         Queries and expects response from Keithley. Input must be a string.
         """
-        logger.debug('write: print(%s)' % value)
+        return self.parse_response(self._query_raw('print(%s)' % value))
+
+    def _query_raw(self, value):
+        """
+        Writes text to Keithley and returns the unparsed response. Unlike
+        :meth:`_query`, the input is sent as is and must print its own output.
+        """
+        logger.debug('write: %s' % value)
 
         if self.connection:
             with self._lock:
-                r = self.connection.query('print(%s)' % value)
+                r = self.connection.query(value)
                 logger.debug('read: %s' % r)
 
-            return self.parse_response(r)
+            return r
         else:
             raise KeithleyIOError(
                 'No connection to keithley present. Try to call connect().')
 
+    def _query_binary(self, value, n_values):
+        """
+        Writes text to Keithley and reads the printed numbers as a block of
+        little-endian REAL64 values. The Keithley returns to ASCII format afterwards.
+        Input must be a string which prints ``n_values`` numbers, e.g., a call to
+        ``printbuffer``.
+
+        :returns: An array of values or `None` if the binary response could not be
+            read. In this case, the output queue of the Keithley is cleared and
+            binary transfers are skipped until the next connection.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._binary_failed:
+            return None
+
+        value = ('format.data = format.REAL64 format.byteorder = format.LITTLEENDIAN '
+                 '%s format.data = format.ASCII' % value)
+        logger.debug('write: %s' % value)
+
+        if not self.connection:
+            raise KeithleyIOError(
+                'No connection to keithley present. Try to call connect().')
+
+        with self._lock:
+            try:
+                r = self.connection.query_binary_values(
+                    value, datatype='d', is_big_endian=False, container=np.array,
+                    data_points=n_values)
+                logger.debug('read: %s values' % len(r))
+                return r
+            except _BINARY_ERRORS:
+                # binary transfer may be unsupported by the interface or the pyvisa
+                # version, discard incomplete responses and make sure that the
+                # Keithley is back in ASCII mode
+                logger.debug('Reading binary values failed, using ASCII format.')
+                self._binary_failed = True
+                try:
+                    self.connection.clear()
+                except visa.VisaIOError:
+                    pass
+                self.connection.write('format.data = format.ASCII')
+                return None
+
+    def _query_blocking(self, value, timeout=None, abort_event=None):
+        """
+        Writes text to Keithley and returns the unparsed response, waiting across
+        multiple read timeouts. Use this for commands which only print once a slow
+        operation has completed. The lock is held throughout so that no other query
+        can receive the response. Other commands would be queued on the Keithley
+        until the operation has completed anyway.
+
+        :param str value: Text to send, must print its own output.
+        :param float timeout: Maximum time to wait in sec. Defaults to `None`,
+            i.e., waiting indefinitely.
+        :param abort_event: Optional :class:`threading.Event` to stop waiting.
+
+        :returns: Unparsed response or `None` if ``abort_event`` was set. In the
+            latter case, the Keithley is cleared to discard the pending response.
+        :rtype: str
+        :raises: :class:`KeithleyIOError` if there is no response within
+            ``timeout``.
+        """
+        logger.debug('write: %s' % value)
+
+        if not self.connection:
+            raise KeithleyIOError(
+                'No connection to keithley present. Try to call connect().')
+
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        with self._lock:
+            self.connection.write(value)
+            while abort_event is None or not abort_event.is_set():
+                try:
+                    r = self.connection.read()
+                    logger.debug('read: %s' % r)
+                    return r
+                except visa.VisaIOError as exc:
+                    if exc.error_code != visa.constants.VI_ERROR_TMO:
+                        raise
+                if timeout is not None and time.time() > deadline:
+                    self.connection.clear()
+                    raise KeithleyIOError(
+                        'Keithley did not respond within %s sec.' % timeout)
+
+            self.connection.clear()
+            return None
+
+    def _wait_for_completion(self, timeout=None):
+        """
+        Waits until all overlapped commands, such as triggered sweeps, have
+        completed. The Keithley only responds once ``waitcomplete()`` returns, so
+        its status does not need to be polled. Waiting stops early if the
+        ``abort_event`` is set.
+
+        :param float timeout: Maximum time to wait in sec. Defaults to `None`,
+            i.e., waiting indefinitely.
+
+        :returns: `True` if all commands have completed, `False` if aborted.
+        :rtype: bool
+        :raises: :class:`KeithleyIOError` if commands do not complete in time.
+        """
+        r = self._query_blocking('waitcomplete() print("done")', timeout,
+                                 self.abort_event)
+        return r is not None
+
     @staticmethod
     def parse_response(string):
+        string = string.rstrip()
+        r = _SPECIAL.get(string, _MISSING)
+        if r is not _MISSING:
+            return r
+
         try:
-            r = float(string)
+            return float(string)
         except ValueError:
-            if string == 'nil':
-                r = None
-            elif string == 'true':
-                r = True
-            elif string == 'false':
-                r = False
-            else:
-                r = string
-
-        return r
+            return string
 
     def _convert_input(self, value):
         """ Convert bool to lower case string and list / tuples to comma
         delimited string enclosed by curly brackets."""
-        if isinstance(value, bool):
+        if type(value) is bool:
             # convert bool True to string 'true'
-            value = str(value).lower()
+            value = _BOOLSTR[value]
         elif isinstance(value, self.TO_TSP_LIST):
             # convert some iterables to a TSP type list '{1,2,3,4}'
             value = '{%s}' % ', '.join(map(str, value))
@@ -489,6 +662,106 @@ class Keithley2600Base(MagicClass):
         return value
 
 
+# TSP functions to configure voltage sweeps. They are defined on the Keithley once per
+# connection such that a sweep can be set up with a single write. Each function is
+# sent as a single line since the Keithley executes every line as a separate chunk.
+
+_TSP_SWEEP_SINGLE_SMU = ' '.join([
+    'function sweepSingleSMU(smu, sweeplist, npts, nplc, delay, end_pulse_action)',
+    # setup smu to sweep through list on trigger
+    'smu.trigger.source.listv(sweeplist)',
+    'smu.trigger.source.action = smu.ENABLE',
+    # configure integration time, settling time and auto-range
+    'smu.measure.nplc = nplc',
+    'smu.measure.delay = delay',
+    'smu.measure.autorangei = smu.AUTORANGE_ON',
+    'smu.source.func = smu.OUTPUT_DCVOLTS',
+    # clear smu buffers
+    'smu.nvbuffer1.clear()',
+    'smu.nvbuffer2.clear()',
+    'smu.nvbuffer1.clearcache()',
+    'smu.nvbuffer2.clearcache()',
+    # display current values during measurement
+    'display.smua.measure.func = display.MEASURE_DCAMPS',
+    'display.smub.measure.func = display.MEASURE_DCAMPS',
+    # trigger count = number of data points in measurement
+    'smu.trigger.count = npts',
+    # measure current and voltage once the source is complete, store in buffers
+    'smu.trigger.measure.action = smu.ENABLE',
+    'smu.trigger.measure.iv(smu.nvbuffer1, smu.nvbuffer2)',
+    'smu.trigger.measure.stimulus = smu.trigger.SOURCE_COMPLETE_EVENT_ID',
+    # hold or idle source between steps and after the sweep
+    'smu.trigger.endpulse.action = end_pulse_action',
+    'smu.trigger.endsweep.action = end_pulse_action',
+    # transition from arm to trigger layer after *trg is received
+    'smu.trigger.arm.stimulus = trigger.EVENT_ID',
+    # blender #1: source when entering the trigger layer or after a completed cycle
+    'trigger.blender[1].orenable = true',
+    'trigger.blender[1].stimulus[1] = smu.trigger.ARMED_EVENT_ID',
+    'trigger.blender[1].stimulus[2] = smu.trigger.PULSE_COMPLETE_EVENT_ID',
+    'smu.trigger.source.stimulus = trigger.blender[1].EVENT_ID',
+    # blender #2: end pulse once the measurement is complete
+    'trigger.blender[2].orenable = true',
+    'trigger.blender[2].stimulus[1] = smu.trigger.MEASURE_COMPLETE_EVENT_ID',
+    'smu.trigger.endpulse.stimulus = trigger.blender[2].EVENT_ID',
+    # turn on smu and prepare it to wait for trigger
+    'smu.source.output = smu.OUTPUT_ON',
+    'smu.trigger.initiate()',
+    'end',
+])
+
+_TSP_SWEEP_DUAL_SMU = ' '.join([
+    'function sweepDualSMU(smu1, smu2, sweeplist1, sweeplist2, npts, nplc, delay,',
+    'end_pulse_action)',
+    # setup smu1 and smu2 to sweep through lists on trigger
+    'smu1.trigger.source.listv(sweeplist1)',
+    'smu2.trigger.source.listv(sweeplist2)',
+    'for _, smu in ipairs({smu1, smu2}) do',
+    'smu.trigger.source.action = smu.ENABLE',
+    # configure integration time, settling time and auto-range
+    'smu.measure.nplc = nplc',
+    'smu.measure.delay = delay',
+    'smu.measure.autorangei = smu.AUTORANGE_ON',
+    'smu.source.func = smu.OUTPUT_DCVOLTS',
+    # clear smu buffers
+    'smu.nvbuffer1.clear()',
+    'smu.nvbuffer2.clear()',
+    'smu.nvbuffer1.clearcache()',
+    'smu.nvbuffer2.clearcache()',
+    # trigger count = number of data points in measurement
+    'smu.trigger.count = npts',
+    # measure current and voltage once the source of smu1 is complete
+    'smu.trigger.measure.action = smu.ENABLE',
+    'smu.trigger.measure.iv(smu.nvbuffer1, smu.nvbuffer2)',
+    'smu.trigger.measure.stimulus = smu1.trigger.SOURCE_COMPLETE_EVENT_ID',
+    # hold or idle source between steps and after the sweep
+    'smu.trigger.endpulse.action = end_pulse_action',
+    'smu.trigger.endsweep.action = end_pulse_action',
+    'end',
+    # display current values during measurement
+    'display.smua.measure.func = display.MEASURE_DCAMPS',
+    'display.smub.measure.func = display.MEASURE_DCAMPS',
+    # transition from arm to trigger layer after *trg is received
+    'smu1.trigger.arm.stimulus = trigger.EVENT_ID',
+    # blender #1: source when entering the trigger layer or after a completed cycle
+    'trigger.blender[1].orenable = true',
+    'trigger.blender[1].stimulus[1] = smu1.trigger.ARMED_EVENT_ID',
+    'trigger.blender[1].stimulus[2] = smu1.trigger.PULSE_COMPLETE_EVENT_ID',
+    'smu1.trigger.source.stimulus = trigger.blender[1].EVENT_ID',
+    # blender #2: end pulse once measurements on both smus are complete
+    'trigger.blender[2].orenable = false',
+    'trigger.blender[2].stimulus[1] = smu1.trigger.MEASURE_COMPLETE_EVENT_ID',
+    'trigger.blender[2].stimulus[2] = smu2.trigger.MEASURE_COMPLETE_EVENT_ID',
+    'smu1.trigger.endpulse.stimulus = trigger.blender[2].EVENT_ID',
+    # turn on smus and prepare them to wait for trigger
+    'smu1.source.output = smu1.OUTPUT_ON',
+    'smu2.source.output = smu2.OUTPUT_ON',
+    'smu1.trigger.initiate()',
+    'smu2.trigger.initiate()',
+    'end',
+])
+
+
 class Keithley2600(Keithley2600Base):
     """Keithley2600 driver with high level functionality
 
@@ -498,6 +771,11 @@ class Keithley2600(Keithley2600Base):
     which have a syntax similar to python.
 
     :cvar list SMU_LIST: List containing strings of all smu names such as 'smua'.
+    :cvar int BUFFER_CHUNK_SIZE: Maximum number of buffer readings which are read
+        from the Keithley in a single query. Longer buffers will be read in chunks.
+    :cvar float SWEEP_TIMEOUT: Maximum time in sec to wait for a sweep to complete.
+        Defaults to `None`, i.e., waiting until the sweep is complete or the
+        ``abort_event`` is set. On timeout, the Keithley is reset.
 
     :ivar str visa_address: Visa address of the instrument.
     :ivar str visa_library: PyVisa backend specification. Defaults to "@py" for pyvisa-py
@@ -549,6 +827,11 @@ class Keithley2600(Keithley2600Base):
     """
 
     SMU_LIST = ['smua', 'smub']
+    BUFFER_CHUNK_SIZE = 2048
+    SWEEP_TIMEOUT = None
+
+    _sweep_functions_loaded = False
+    _smu_strings = {}
 
     def __init__(self, visa_address, visa_library='@py', **kwargs):
         Keithley2600Base.__init__(self, visa_address, visa_library, **kwargs)
@@ -556,39 +839,134 @@ class Keithley2600(Keithley2600Base):
     def __repr__(self):
         return '<%s(%s)>' % (type(self).__name__, self.visa_address)
 
+    def disconnect(self):
+        """
+        Disconnects from Keithley.
+        """
+        Keithley2600Base.disconnect(self)
+        # sweep functions need to be defined again after reconnecting
+        self._sweep_functions_loaded = False
+
     def _check_smu(self, smu):
         """
         Check if selected smu is indeed present.
 
         :param smu: A keithley smu instance.
         """
-        assert smu._name.split('.')[-1] in self.SMU_LIST
+        assert self._get_smu_string(smu) in self.SMU_LIST
 
-    @staticmethod
-    def _get_smu_string(smu):
-        return smu._name.split('.')[-1]
+    @classmethod
+    def _get_smu_string(cls, smu):
+        """
+        Returns the name of a keithley smu instance, such as 'smua'. Results are
+        cached by the full TSP name of the smu.
+
+        :param smu: A keithley smu instance.
+        """
+        try:
+            return cls._smu_strings[smu._name]
+        except KeyError:
+            smu_string = cls._smu_strings[smu._name] = smu._name.split('.')[-1]
+            return smu_string
+
+    def _get_nplc(self, t_int):
+        """
+        Converts an integration time to a number of power line cycles.
+
+        :param float t_int: Integration time in sec. Value must be between 0.001
+            and 25 power line cycles (50Hz or 60 Hz).
+        :returns: Number of power line cycles.
+        :rtype: float
+        :raises: :class:`ValueError` for too short or too long integration times.
+        """
+        # line frequency is cached since it does not change while connected
+        if self._linefreq is None:
+            self._linefreq = self.localnode.linefreq
+        freq = self._linefreq
+        nplc = t_int * freq
+
+        if nplc < 0.001 or nplc > 25:
+            raise ValueError('Integration time must be between 0.001 and 25 ' +
+                             'power line cycles of 1/(%s Hz).' % freq)
+        return nplc
+
+    def _to_tsp_list(self, values, name):
+        """
+        Converts a list of values to a TSP list. Lists longer than
+        :attr:`CHUNK_SIZE` are assembled on the Keithley in a variable instead.
+
+        :param values: List, tuple or numpy array of values.
+        :param str name: Name of the TSP variable for long lists.
+        :returns: TSP list or variable name.
+        :rtype: str
+        """
+        if len(values) > self.CHUNK_SIZE:
+            self._write('%s = {}' % name)
+            for num in values:
+                self._write('table.insert(%s, %s)' % (name, num))
+            return name
+        else:
+            return self._convert_input(values)
+
+    def _load_sweep_functions(self):
+        """
+        Defines the TSP functions used to configure voltage sweeps on the Keithley,
+        once per connection.
+        """
+        if not self._sweep_functions_loaded:
+            self._write(_TSP_SWEEP_SINGLE_SMU)
+            self._write(_TSP_SWEEP_DUAL_SMU)
+            self._sweep_functions_loaded = True
 
 # =============================================================================
 # Define lower level control functions
 # =============================================================================
 
-    @staticmethod
-    def readBuffer(buffer):
+    def readBuffer(self, buffer):
         """
-        Reads buffer values and returns them as a list. This can be done more
-        quickly by calling :attr:`buffer.readings` but such a call may fail due
-        to I/O limitations of the keithley if the returned list is too long.
+        Reads buffer values and returns them as a numpy array. Readings are
+        transferred with the TSP command ``printbuffer`` in chunks of
+        :attr:`BUFFER_CHUNK_SIZE` values. This avoids one query per reading while
+        respecting the I/O limitations of the keithley for long responses.
 
         :param buffer: A keithley buffer instance.
 
-        :returns: A list with buffer readings.
-        :rtype: list
+        :returns: An array with buffer readings.
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._read_buffers(buffer)[0]
+
+    def _read_buffers(self, *buffers):
+        """
+        Reads several buffers of equal length at once. ``printbuffer`` accepts
+        multiple buffers and interleaves their readings, such that all buffers are
+        transferred with a single query per chunk. Readings are transferred in binary
+        format, falling back to ASCII if this fails.
+
+        :param buffers: Keithley buffer instances.
+
+        :returns: An array with one row of readings per buffer.
+        :rtype: :class:`numpy.ndarray`
         """
-        list_out = []
-        for i in range(0, int(buffer.n)):
-            list_out.append(buffer.readings[i+1])
+        n = int(buffers[0].n)
+        n_buffers = len(buffers)
+        names = ', '.join('%s.readings' % buffer._name for buffer in buffers)
+        chunk_size = max(self.BUFFER_CHUNK_SIZE // n_buffers, 1)
 
-        return list_out
+        readings = np.empty((n_buffers, n))
+
+        for start in range(1, n + 1, chunk_size):
+            end = min(start + chunk_size - 1, n)
+            cmd = 'printbuffer(%d, %d, %s)' % (start, end, names)
+            n_values = (end - start + 1) * n_buffers
+
+            values = self._query_binary(cmd, n_values)
+            if values is None or len(values) != n_values:
+                values = np.fromstring(self._query_raw(cmd), sep=',')
+
+            readings[:, start-1:end] = values.reshape(-1, n_buffers).T
+
+        return readings
 
     def clearBuffer(self, smu):
         """
@@ -613,13 +991,7 @@ class Keithley2600(Keithley2600Base):
         self._check_smu(smu)
 
         # determine number of power-line-cycles used for integration
-        freq = self.localnode.linefreq
-        nplc = t_int * freq
-
-        if nplc < 0.001 or nplc > 25:
-            raise ValueError('Integration time must be between 0.001 and 25 ' +
-                             'power line cycles of 1/(%s Hz).' % freq)
-        smu.measure.nplc = nplc
+        smu.measure.nplc = self._get_nplc(t_int)
 
     def applyVoltage(self, smu, voltage):
         """
@@ -646,7 +1018,7 @@ class Keithley2600(Keithley2600Base):
         smu.source.leveli = curr
         smu.source.output = smu.OUTPUT_ON
 
-    def rampToVoltage(self, smu, target_volt, delay=0.1, step_size=1):
+    def rampToVoltage(self, smu, target_volt, delay=0.1, step_size=1, tsp_ramp=True):
         """
         Ramps up the voltage of the specified SMU. Beeps when done.
 
@@ -654,6 +1026,9 @@ class Keithley2600(Keithley2600Base):
         :param float target_volt: Target voltage in Volts.
         :param float step_size: Size of the voltage steps in Volts.
         :param float delay: Delay between steps in sec.
+        :param bool tsp_ramp: If `True`, the ramp is run as a TSP loop on the
+            Keithley itself. Otherwise, every voltage step is sent separately.
+            Defaults to `True`.
         """
 
         self._check_smu(smu)
@@ -668,14 +1043,25 @@ class Keithley2600(Keithley2600Base):
         self.display.smua.measure.func = self.display.MEASURE_DCVOLTS
         self.display.smub.measure.func = self.display.MEASURE_DCVOLTS
 
-        step = np.sign(target_volt - vcurr) * abs(step_size)
-
-        for v in np.arange(vcurr, target_volt + step, step):
-            smu.source.levelv = v
-            smu.measure.v()
-            time.sleep(delay)
+        # number of points including start and target voltage
+        n_steps = int(np.ceil(abs(target_volt - vcurr) / abs(step_size))) + 1
+
+        if tsp_ramp:
+            # send the entire ramp in a single message, the Keithley computes the
+            # steps and only prints the final voltage once the ramp is complete
+            r = self._query_blocking(
+                'for i = 0, %d do %s.source.levelv = %s + i * (%s) / %d '
+                '%s.measure.v() delay(%s) end print(%s.measure.v())' %
+                (n_steps - 1, smu._name, vcurr, target_volt - vcurr, n_steps - 1,
+                 smu._name, delay, smu._name))
+            target_volt = self.parse_response(r)
+        else:
+            for v in np.linspace(vcurr, target_volt, n_steps):
+                smu.source.levelv = v
+                smu.measure.v()
+                time.sleep(delay)
 
-        target_volt = smu.measure.v()
+            target_volt = smu.measure.v()
         logger.info('Gate voltage set to Vg = %s V.' % round(target_volt))
 
         self.beeper.beep(0.3, 2400)
@@ -694,84 +1080,27 @@ class Keithley2600(Keithley2600Base):
             an automatic measurement once the current is stable.
         :param bool pulsed: `True` or `False` for pulsed or continuous sweep.
 
-        :returns: Lists of voltages and currents measured during the sweep (in Volt and
-            Ampere, respectively): ``(v_smu, i_smu)``.
-        :rtype: (list, list)
+        :returns: Arrays of voltages and currents measured during the sweep (in Volt
+            and Ampere, respectively): ``(v_smu, i_smu)``.
+        :rtype: (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
         """
 
         # input checks
         self._check_smu(smu)
 
+        # buffers for current and voltage readings
+        buffers = (smu.nvbuffer1, smu.nvbuffer2)
+
         # set state to busy
         self.busy = True
-        # Define lists containing results. If we abort early, we have something to return.
-        v_smu, i_smu = [], []
+        # Define arrays containing results. If we abort early, we have something to return.
+        v_smu, i_smu = np.array([]), np.array([])
 
         if self.abort_event.is_set():
             self.busy = False
             return v_smu, i_smu
 
-        # setup smu to sweep through list on trigger
-        # send sweep_list over in chunks if too long
-        if len(smu_sweeplist) > self.CHUNK_SIZE:
-            self._write('mylist = {}')
-            for num in smu_sweeplist:
-                self._write('table.insert(mylist, %s)' % num)
-            smu.trigger.source.listv('mylist')
-        else:
-            smu.trigger.source.listv(smu_sweeplist)
-
-        smu.trigger.source.action = smu.ENABLE
-
-        # CONFIGURE INTEGRATION TIME FOR EACH MEASUREMENT
-        self.setIntegrationTime(smu, t_int)
-
-        # CONFIGURE SETTLING TIME FOR GATE VOLTAGE, I-LIMIT, ETC...
-        smu.measure.delay = delay
-        smu.measure.autorangei = smu.AUTORANGE_ON
-
-        # smu.trigger.source.limiti = 0.1
-
-        smu.source.func = smu.OUTPUT_DCVOLTS
-
-        # 2-wire measurement (use SENSE_REMOTE for 4-wire)
-        # smu.sense = smu.SENSE_LOCAL
-
-        # clears SMU buffers
-        smu.nvbuffer1.clear()
-        smu.nvbuffer2.clear()
-
-        smu.nvbuffer1.clearcache()
-        smu.nvbuffer2.clearcache()
-
-        # display current values during measurement
-        self.display.smua.measure.func = self.display.MEASURE_DCAMPS
-        self.display.smub.measure.func = self.display.MEASURE_DCAMPS
-
-        # SETUP TRIGGER ARM AND COUNTS
-        # trigger count = number of data points in measurement
-        # arm count = number of times the measurement is repeated (set to 1)
-
-        npts = len(smu_sweeplist)
-        smu.trigger.count = npts
-
-        # SET THE MEASUREMENT TRIGGER ON BOTH SMU'S
-        # Set measurement to trigger once a change in the gate value on
-        # sweep smu is complete, i.e., a measurement will occur
-        # after the voltage is stepped.
-        # Both channels should be set to trigger on the sweep smu event
-        # so the measurements occur at the same time.
-
-        # enable smu
-        smu.trigger.measure.action = smu.ENABLE
-
-        # measure current and voltage on trigger, store in buffer of smu
-        smu.trigger.measure.iv(smu.nvbuffer1, smu.nvbuffer2)
-
-        # initiate measure trigger when source is complete
-        smu.trigger.measure.stimulus = smu.trigger.SOURCE_COMPLETE_EVENT_ID
-
-        # SET THE ENDPULSE ACTION TO HOLD
+        # SET THE ENDPULSE AND ENDSWEEP ACTIONS
         # Options are SOURCE_HOLD AND SOURCE_IDLE, hold maintains same voltage
         # throughout step in sweep (typical IV sweep behavior). idle will allow
         # pulsed IV sweeps.
@@ -783,85 +1112,40 @@ class Keithley2600(Keithley2600Base):
         else:
             raise TypeError("'pulsed' must be of type 'bool'.")
 
-        smu.trigger.endpulse.action = end_pulse_action
-
-        # SET THE ENDSWEEP ACTION TO HOLD IF NOT PULSED
-        # Output voltage will be held after sweep is done!
-
-        smu.trigger.endsweep.action = end_pulse_action
-
-        # SET THE EVENT TO TRIGGER THE SMU'S TO THE ARM LAYER
-        # A typical measurement goes from idle -> arm -> trigger.
-        # The 'trigger.event_id' option sets the transition arm -> trigger
-        # to occur after sending *trg to the instrument.
-
-        smu.trigger.arm.stimulus = self.trigger.EVENT_ID
-
-        # Prepare an event blender (blender #1) that triggers when
-        # the smua enters the trigger layer or reaches the end of a
-        # single trigger layer cycle.
-
-        # triggers when either of the stimuli are true ('or enable')
-        self.trigger.blender[1].orenable = True
-        self.trigger.blender[1].stimulus[1] = smu.trigger.ARMED_EVENT_ID
-        self.trigger.blender[1].stimulus[2] = smu.trigger.PULSE_COMPLETE_EVENT_ID
-
-        # SET THE smu SOURCE STIMULUS TO BE EVENT BLENDER #1
-        # A source measure cycle within the trigger layer will occur when
-        # either the trigger layer is entered (termed 'armed event') for the
-        # first time or a single cycle of the trigger layer is complete (termed
-        # 'pulse complete event').
-
-        smu.trigger.source.stimulus = self.trigger.blender[1].EVENT_ID
-
-        # PREPARE AN EVENT BLENDER (blender #2) THAT TRIGGERS WHEN BOTH SMU'S
-        # HAVE COMPLETED A MEASUREMENT.
-        # This is needed to prevent the next source measure cycle from occurring
-        # before the measurement on both channels is complete.
-
-        self.trigger.blender[2].orenable = True  # triggers when both stimuli are true
-        self.trigger.blender[2].stimulus[1] = smu.trigger.MEASURE_COMPLETE_EVENT_ID
-
-        # SET THE SMU ENDPULSE STIMULUS TO BE EVENT BLENDER #2
-        smu.trigger.endpulse.stimulus = self.trigger.blender[2].EVENT_ID
+        # CONFIGURE THE SWEEP AND PREPARE THE SMU TO WAIT FOR TRIGGER
+        # The full configuration is done by a TSP function on the Keithley which
+        # only needs to be called once. See _TSP_SWEEP_SINGLE_SMU for details.
 
-        # TURN ON smu
-        smu.source.output = smu.OUTPUT_ON
+        npts = len(smu_sweeplist)
 
-        # INITIATE MEASUREMENT
-        # prepare SMUs to wait for trigger
-        smu.trigger.initiate()
+        self._load_sweep_functions()
+        self._write('sweepSingleSMU(%s, %s, %s, %s, %s, %s)' % (
+            smu._name, self._to_tsp_list(smu_sweeplist, 'mylist'),
+            npts, self._get_nplc(t_int), delay, end_pulse_action))
 
         # send trigger
         self._write('*trg')
 
-        # CHECK STATUS BUFFER FOR MEASUREMENT TO FINISH
-        # Possible return values:
-        # 6 = smua and smub sweeping
-        # 4 = only smub sweeping
-        # 2 = only smua sweeping
-        # 0 = neither smu sweeping
-
-        status = 0
-        while status == 0:  # while loop that runs until the sweep begins
-            status = self.status.operation.sweeping.condition
-            time.sleep(0.1)
-
-        while status > 0:  # while loop that runs until the sweep ends
-            status = self.status.operation.sweeping.condition
-            time.sleep(0.1)
-
-        # EXTRACT DATA FROM SMU BUFFERS
-        i_smu = self.readBuffer(smu.nvbuffer1)
-        v_smu = self.readBuffer(smu.nvbuffer2)
-
-        smu.nvbuffer1.clear()
-        smu.nvbuffer2.clear()
-
-        smu.nvbuffer1.clearcache()
-        smu.nvbuffer2.clearcache()
-
-        self.busy = False
+        try:
+            # WAIT FOR MEASUREMENT TO FINISH
+            try:
+                completed = self._wait_for_completion(self.SWEEP_TIMEOUT)
+            except KeithleyIOError:
+                # stop the sweep and switch off the outputs before giving up
+                self._write('reset()')
+                raise
+
+            if not completed:
+                return v_smu, i_smu
+
+            # EXTRACT DATA FROM SMU BUFFERS
+            i_smu, v_smu = self._read_buffers(*buffers)
+
+            # CLEAR BUFFERS
+            self._write_many(['%s.%s()' % (buffer._name, cmd)
+                              for cmd in ('clear', 'clearcache') for buffer in buffers])
+        finally:
+            self.busy = False
 
         return v_smu, i_smu
 
@@ -883,9 +1167,10 @@ class Keithley2600(Keithley2600Base):
             an automatic measurement once the current is stable.
         :param bool pulsed: `True` or `False` for pulsed or continuous sweep.
 
-        :returns: Lists of voltages and currents measured during the sweep (in Volt and
-            Ampere, respectively): ``(v_smu1, i_smu1, v_smu2, i_smu2)``.
-        :rtype: (list, list, list, list)
+        :returns: Arrays of voltages and currents measured during the sweep (in Volt
+            and Ampere, respectively): ``(v_smu1, i_smu1, v_smu2, i_smu2)``.
+        :rtype: (:class:`numpy.ndarray`, :class:`numpy.ndarray`,
+            :class:`numpy.ndarray`, :class:`numpy.ndarray`)
         """
 
         # input checks
@@ -894,99 +1179,19 @@ class Keithley2600(Keithley2600Base):
 
         assert len(smu1_sweeplist) == len(smu2_sweeplist)
 
+        # buffers for current and voltage readings
+        buffers = (smu1.nvbuffer1, smu1.nvbuffer2, smu2.nvbuffer1, smu2.nvbuffer2)
+
         # set state to busy
         self.busy = True
-        # Define lists containing results. If we abort early, we have something to return.
-        v_smu1, i_smu1, v_smu2, i_smu2 = [], [], [], []
+        # Define arrays containing results. If we abort early, we have something to return.
+        v_smu1, i_smu1, v_smu2, i_smu2 = (np.array([]),) * 4
 
         if self.abort_event.is_set():
             self.busy = False
             return v_smu1, i_smu1, v_smu2, i_smu2
 
-        # Setup smua/smub for sweep measurement.
-
-        # setup smu1 and smu2 to sweep through lists on trigger
-        # send sweep_list over in chunks if too long
-        if len(smu1_sweeplist) > self.CHUNK_SIZE:
-            self._write('mylist = {}')
-            for num in smu1_sweeplist:
-                self._write('table.insert(mylist, %s)' % num)
-            smu1.trigger.source.listv('mylist')
-        else:
-            smu1.trigger.source.listv(smu1_sweeplist)
-
-        if len(smu2_sweeplist) > self.CHUNK_SIZE:
-            self._write('mylist = {}')
-            for num in smu2_sweeplist:
-                self._write('table.insert(mylist, %s)' % num)
-            smu2.trigger.source.listv('mylist')
-        else:
-            smu2.trigger.source.listv(smu2_sweeplist)
-
-        smu1.trigger.source.action = smu1.ENABLE
-        smu2.trigger.source.action = smu2.ENABLE
-
-        # CONFIGURE INTEGRATION TIME FOR EACH MEASUREMENT
-        self.setIntegrationTime(smu1, t_int)
-        self.setIntegrationTime(smu2, t_int)
-
-        # CONFIGURE SETTLING TIME FOR GATE VOLTAGE, I-LIMIT, ETC...
-        smu1.measure.delay = delay
-        smu2.measure.delay = delay
-
-        smu1.measure.autorangei = smu1.AUTORANGE_ON
-        smu2.measure.autorangei = smu2.AUTORANGE_ON
-
-        # smu1.trigger.source.limiti = 0.1
-        # smu2.trigger.source.limiti = 0.1
-
-        smu1.source.func = smu1.OUTPUT_DCVOLTS
-        smu2.source.func = smu2.OUTPUT_DCVOLTS
-
-        # 2-wire measurement (use SENSE_REMOTE for 4-wire)
-        # smu1.sense = smu1.SENSE_LOCAL
-        # smu2.sense = smu2.SENSE_LOCAL
-
-        # CLEAR BUFFERS
-        for smu in [smu1, smu2]:
-            smu.nvbuffer1.clear()
-            smu.nvbuffer2.clear()
-            smu.nvbuffer1.clearcache()
-            smu.nvbuffer2.clearcache()
-
-        # display current values during measurement
-        self.display.smua.measure.func = self.display.MEASURE_DCAMPS
-        self.display.smub.measure.func = self.display.MEASURE_DCAMPS
-
-        # SETUP TRIGGER ARM AND COUNTS
-        # trigger count = number of data points in measurement
-        # arm count = number of times the measurement is repeated (set to 1)
-
-        npts = len(smu1_sweeplist)
-
-        smu1.trigger.count = npts
-        smu2.trigger.count = npts
-
-        # SET THE MEASUREMENT TRIGGER ON BOTH SMU'S
-        # Set measurement to trigger once a change in the gate value on
-        # sweep smu is complete, i.e., a measurement will occur
-        # after the voltage is stepped.
-        # Both channels should be set to trigger on the sweep smu event
-        # so the measurements occur at the same time.
-
-        # enable smu
-        smu1.trigger.measure.action = smu1.ENABLE
-        smu2.trigger.measure.action = smu2.ENABLE
-
-        # measure current and voltage on trigger, store in buffer of smu
-        smu1.trigger.measure.iv(smu1.nvbuffer1, smu1.nvbuffer2)
-        smu2.trigger.measure.iv(smu2.nvbuffer1, smu2.nvbuffer2)
-
-        # initiate measure trigger when source is complete
-        smu1.trigger.measure.stimulus = smu1.trigger.SOURCE_COMPLETE_EVENT_ID
-        smu2.trigger.measure.stimulus = smu1.trigger.SOURCE_COMPLETE_EVENT_ID
-
-        # SET THE ENDPULSE ACTION TO HOLD
+        # SET THE ENDPULSE AND ENDSWEEP ACTIONS
         # Options are SOURCE_HOLD AND SOURCE_IDLE, hold maintains same voltage
         # throughout step in sweep (typical IV sweep behavior). idle will allow
         # pulsed IV sweeps.
@@ -998,92 +1203,41 @@ class Keithley2600(Keithley2600Base):
         else:
             raise TypeError("'pulsed' must be of type 'bool'.")
 
-        smu1.trigger.endpulse.action = end_pulse_action
-        smu2.trigger.endpulse.action = end_pulse_action
+        # CONFIGURE THE SWEEP AND PREPARE THE SMUS TO WAIT FOR TRIGGER
+        # The full configuration is done by a TSP function on the Keithley which
+        # only needs to be called once. See _TSP_SWEEP_DUAL_SMU for details.
 
-        # SET THE ENDSWEEP ACTION TO HOLD IF NOT PULSED
-        # Output voltage will be held after sweep is done!
-
-        smu1.trigger.endsweep.action = end_pulse_action
-        smu2.trigger.endsweep.action = end_pulse_action
-
-        # SET THE EVENT TO TRIGGER THE SMU'S TO THE ARM LAYER
-        # A typical measurement goes from idle -> arm -> trigger.
-        # The 'trigger.event_id' option sets the transition arm -> trigger
-        # to occur after sending *trg to the instrument.
-
-        smu1.trigger.arm.stimulus = self.trigger.EVENT_ID
-
-        # Prepare an event blender (blender #1) that triggers when
-        # the smua enters the trigger layer or reaches the end of a
-        # single trigger layer cycle.
-
-        # triggers when either of the stimuli are true ('or enable')
-        self.trigger.blender[1].orenable = True
-        self.trigger.blender[1].stimulus[1] = smu1.trigger.ARMED_EVENT_ID
-        self.trigger.blender[1].stimulus[2] = smu1.trigger.PULSE_COMPLETE_EVENT_ID
-
-        # SET THE smu1 SOURCE STIMULUS TO BE EVENT BLENDER #1
-        # A source measure cycle within the trigger layer will occur when
-        # either the trigger layer is entered (termed 'armed event') for the
-        # first time or a single cycle of the trigger layer is complete (termed
-        # 'pulse complete event').
-
-        smu1.trigger.source.stimulus = self.trigger.blender[1].EVENT_ID
-
-        # PREPARE AN EVENT BLENDER (blender #2) THAT TRIGGERS WHEN BOTH SMU'S
-        # HAVE COMPLETED A MEASUREMENT.
-        # This is needed to prevent the next source measure cycle from occurring
-        # before the measurement on both channels is complete.
-
-        self.trigger.blender[2].orenable = False  # triggers when both stimuli are true
-        self.trigger.blender[2].stimulus[1] = smu1.trigger.MEASURE_COMPLETE_EVENT_ID
-        self.trigger.blender[2].stimulus[2] = smu2.trigger.MEASURE_COMPLETE_EVENT_ID
-
-        # SET THE smu1 ENDPULSE STIMULUS TO BE EVENT BLENDER #2
-        smu1.trigger.endpulse.stimulus = self.trigger.blender[2].EVENT_ID
+        npts = len(smu1_sweeplist)
 
-        # TURN ON smu1 AND smu2
-        smu1.source.output = smu1.OUTPUT_ON
-        smu2.source.output = smu2.OUTPUT_ON
+        self._load_sweep_functions()
+        self._write('sweepDualSMU(%s, %s, %s, %s, %s, %s, %s, %s)' % (
+            smu1._name, smu2._name, self._to_tsp_list(smu1_sweeplist, 'mylist1'),
+            self._to_tsp_list(smu2_sweeplist, 'mylist2'), npts,
+            self._get_nplc(t_int), delay, end_pulse_action))
 
-        # INITIATE MEASUREMENT
-        # prepare SMUs to wait for trigger
-        smu1.trigger.initiate()
-        smu2.trigger.initiate()
         # send trigger
         self._write('*trg')
 
-        # CHECK STATUS BUFFER FOR MEASUREMENT TO FINISH
-        # Possible return values:
-        # 6 = smua and smub sweeping
-        # 4 = only smub sweeping
-        # 2 = only smua sweeping
-        # 0 = neither smu sweeping
-
-        status = 0
-        while status == 0:  # while loop that runs until the sweep begins
-            status = self.status.operation.sweeping.condition
-            time.sleep(0.1)
-
-        while status > 0:  # while loop that runs until the sweep ends
-            status = self.status.operation.sweeping.condition
-            time.sleep(0.1)
-
-        # EXTRACT DATA FROM SMU BUFFERS
-        i_smu1 = self.readBuffer(smu1.nvbuffer1)
-        v_smu1 = self.readBuffer(smu1.nvbuffer2)
-        i_smu2 = self.readBuffer(smu2.nvbuffer1)
-        v_smu2 = self.readBuffer(smu2.nvbuffer2)
-
-        # CLEAR BUFFERS
-        for smu in [smu1, smu2]:
-            smu.nvbuffer1.clear()
-            smu.nvbuffer2.clear()
-            smu.nvbuffer1.clearcache()
-            smu.nvbuffer2.clearcache()
-
-        self.busy = False
+        try:
+            # WAIT FOR MEASUREMENT TO FINISH
+            try:
+                completed = self._wait_for_completion(self.SWEEP_TIMEOUT)
+            except KeithleyIOError:
+                # stop the sweep and switch off the outputs before giving up
+                self._write('reset()')
+                raise
+
+            if not completed:
+                return v_smu1, i_smu1, v_smu2, i_smu2
+
+            # EXTRACT DATA FROM SMU BUFFERS
+            i_smu1, v_smu1, i_smu2, v_smu2 = self._read_buffers(*buffers)
+
+            # CLEAR BUFFERS
+            self._write_many(['%s.%s()' % (buffer._name, cmd)
+                              for cmd in ('clear', 'clearcache') for buffer in buffers])
+        finally:
+            self.busy = False
 
         return v_smu1, i_smu1, v_smu2, i_smu2
 
@@ -1091,6 +1245,20 @@ class Keithley2600(Keithley2600Base):
 # Define higher level control functions
 # =============================================================================
 
+    @staticmethod
+    def _append_currents(rt, i_d, i_g, v_step):
+        """
+        Appends source, drain and gate currents from a sweep to a result table.
+
+        :param rt: A :class:`sweep_data.TransistorSweepData` instance.
+        :param i_d: Drain currents measured during the sweep.
+        :param i_g: Gate currents measured during the sweep.
+        :param float v_step: Voltage of the stepped SMU during the sweep.
+        """
+        rt.append_column(i_d + i_g, name='Source current (Vd = %s)' % v_step, unit='A')
+        rt.append_column(i_d, name='Drain current (Vd = %s)' % v_step, unit='A')
+        rt.append_column(i_g, name='Gate current (Vd = %s)' % v_step, unit='A')
+
     def transferMeasurement(self, smu_gate, smu_drain, vg_start, vg_stop,
                             vg_step, vd_list, t_int, delay, pulsed):
         """
@@ -1139,8 +1307,7 @@ class Keithley2600(Keithley2600Base):
 
             # check for abort event
             if self.abort_event.is_set():
-                self.reset()
-                self.beeper.beep(0.3, 2400)
+                self._write_many(['reset()', 'beeper.beep(0.3, 2400)'])
                 return rt
 
             # create array with drain voltages
@@ -1155,14 +1322,11 @@ class Keithley2600(Keithley2600Base):
                     delay, pulsed
                     )
 
+            # add sweep results to ResultTable instance
             if not self.abort_event.is_set():
-                i_s = np.array(i_d) + np.array(i_g)
-                rt.append_column(i_s, name='Source current (Vd = %s)' % vdrain, unit='A')
-                rt.append_column(i_d, name='Drain current (Vd = %s)' % vdrain, unit='A')
-                rt.append_column(i_g, name='Gate current (Vd = %s)' % vdrain, unit='A')
+                self._append_currents(rt, i_d, i_g, vdrain)
 
-        self.reset()
-        self.beeper.beep(0.3, 2400)
+        self._write_many(['reset()', 'beeper.beep(0.3, 2400)'])
 
         self.busy = False
         return rt
@@ -1211,8 +1375,7 @@ class Keithley2600(Keithley2600Base):
 
         for vgate in vg_list:
             if self.abort_event.is_set():
-                self.reset()
-                self.beeper.beep(0.3, 2400)
+                self._write_many(['reset()', 'beeper.beep(0.3, 2400)'])
                 return rt
 
             # create array with gate voltages
@@ -1224,14 +1387,11 @@ class Keithley2600(Keithley2600Base):
                     delay, pulsed
                     )
 
+            # add sweep results to ResultTable instance
             if not self.abort_event.is_set():
-                i_s = np.array(i_d) + np.array(i_g)
-                rt.append_column(i_s, name='Source current (Vd = %s)' % vgate, unit='A')
-                rt.append_column(i_d, name='Drain current (Vd = %s)' % vgate, unit='A')
-                rt.append_column(i_g, name='Gate current (Vd = %s)' % vgate, unit='A')
+                self._append_currents(rt, i_d, i_g, vgate)
 
-        self.reset()
-        self.beeper.beep(0.3, 2400)
+        self._write_many(['reset()', 'beeper.beep(0.3, 2400)'])
 
         self.busy = False
         return rt
@@ -1239,20 +1399,20 @@ class Keithley2600(Keithley2600Base):
     def playChord(self, direction='up'):
         """Plays a chord on the Keithley.
 
-        :param str direction: 'up' or 'done' for upward or downward chord
+        :param str direction: 'up' or 'down' for upward or downward chord
         """
-        if direction is 'up':
-            self.beeper.beep(0.3, 1046.5)
-            self.beeper.beep(0.3, 1318.5)
-            self.beeper.beep(0.3, 1568)
-
-        elif direction is 'down':
-            self.beeper.beep(0.3, 1568)
-            self.beeper.beep(0.3, 1318.5)
-            self.beeper.beep(0.3, 1046.5)
+        if direction == 'up':
+            self._write_many(['beeper.beep(0.3, 1046.5)',
+                              'beeper.beep(0.3, 1318.5)',
+                              'beeper.beep(0.3, 1568)'])
+
+        elif direction == 'down':
+            self._write_many(['beeper.beep(0.3, 1568)',
+                              'beeper.beep(0.3, 1318.5)',
+                              'beeper.beep(0.3, 1046.5)'])
         else:
-            self.beeper.beep(0.2, 1046.5)
-            self.beeper.beep(0.1, 1046.5)
+            self._write_many(['beeper.beep(0.2, 1046.5)',
+                              'beeper.beep(0.1, 1046.5)'])
 
 
 class Keithley2600Factory(object):